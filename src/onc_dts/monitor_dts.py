@@ -3,34 +3,106 @@ from dotenv import load_dotenv, find_dotenv
 import os
 import logging
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from onc_dts.utils import parse_xt_json
 from time import sleep
+from concurrent.futures import Future
+import queue
+from collections import deque
+import threading
 import json
 
-import itertools
-import sys
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
-spinner = itertools.cycle(['-', '/', '|', '\\'])
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-env_file = find_dotenv(usecwd=True)
-logger.info(f"Loading .env file from: {env_file}")
-out = load_dotenv(env_file, verbose=True)
-logger.info(f".env loaded: {out}")
+# Only search for a .env file if the token is not already in the environment
+if "ONC_API_TOKEN" not in os.environ:
+    env_file = find_dotenv(usecwd=True)
+    logger.info("Loading .env file from: %s", env_file)
+    if env_file:
+        out = load_dotenv(env_file)
+        logger.info(".env loaded: %s", out)
 
 ONC_API_TOKEN = os.getenv("ONC_API_TOKEN")
 
 working_dir = os.getcwd()
-logger.info(f"Working directory: {working_dir}")
+logger.info("Working directory: %s", working_dir)
 
 if not ONC_API_TOKEN:
-    logger.warning(f"ONC_API_TOKEN not found in environment variables. {ONC_API_TOKEN}")
+    logger.warning("ONC_API_TOKEN not found in environment variables. %s", ONC_API_TOKEN)
 
-def fetch_onc_realtime_data(device_code, date_from, get_latest=False, row_limit=100):
+# Shared session so consecutive polls reuse the keep-alive TLS connection
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504),
+                      raise_on_status=False),
+))
+
+# ETag/Last-Modified and decoded body of the last revalidated poll per device,
+# so repeated polls for the same window can be answered by a 304 Not Modified
+_CONDITIONAL_CACHE = {}
+
+# Only rawData records starting with this prefix carry DTS measurements
+GETDATA_PREFIX = '{"Cmd":"getData",'
+
+# Rows requested per page while catching up; most rows are not getData records
+ROW_LIMIT = 1000
+
+# simdjson parsers reuse their buffers between documents but are not thread safe
+_thread_local = threading.local()
+
+def _parse_rawdata_page(content):
+    """
+    Decodes only the fields of a rawdata response that RawDataFetcher uses.
+
+    With simdjson installed the response is navigated lazily and only
+    'data[*].rawData', 'data[*].sampleTime' and 'next.parameters.dateFrom'
+    are copied out; otherwise the whole document is decoded.
+
+    Args:
+        content (bytes): Body of the API response.
+
+    Returns:
+        dict: The response, reduced to the fields above when simdjson is available.
+    """
+    if simdjson is None:
+        return _loads(content)
+
+    parser = getattr(_thread_local, 'parser', None)
+    if parser is None:
+        parser = _thread_local.parser = simdjson.Parser()
+    doc = parser.parse(content)
+
+    # Copy out plain Python objects, the document is invalidated by the next parse
+    page = {
+        'data': [{'rawData': item['rawData'], 'sampleTime': item['sampleTime']} for item in doc['data']],
+        'next': None,
+    }
+    try:
+        page['next'] = {'parameters': {'dateFrom': doc['next']['parameters']['dateFrom']}}
+    except (KeyError, TypeError):
+        pass
+    return page
+
+def fetch_onc_realtime_data(device_code, date_from, get_latest=False, row_limit=100, loads=_loads,
+                            revalidate=False):
     """
     Fetches ONC Realtime Data - raw readings for a given device and saves the response as JSON.
 
@@ -44,6 +116,9 @@ def fetch_onc_realtime_data(device_code, date_from, get_latest=False, row_limit=
         onc_api_token (str): ONC API token for authentication.
         data_dir (Path): Directory to save data.
         logging (logging.Logger): Logger for info/error messages.
+        loads (callable): Function used to decode the response body.
+        revalidate (bool): Send ETag/Last-Modified validators for a repeated request
+            and reuse the previous result on 304 Not Modified.
 
     Returns:
         dict: The JSON response from the API if successful, None otherwise.
@@ -62,9 +137,35 @@ def fetch_onc_realtime_data(device_code, date_from, get_latest=False, row_limit=
         "token": ONC_API_TOKEN
     }
 
-    response = requests.get(url, params=params)
+    request_key = (date_from, get_latest, row_limit, loads)
+    cached = _CONDITIONAL_CACHE.get(device_code) if revalidate else None
+    if cached is not None and cached[0] != request_key:
+        cached = None
+    headers = {}
+    if cached is not None:
+        _, etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    try:
+        response = _SESSION.get(url, params=params, headers=headers, timeout=30)
+    except requests.RequestException as e:
+        # Timeouts and dropped connections are reported like HTTP errors so callers keep polling
+        logger.error("Error: %s", e)
+        return None
+    if response.status_code == 304 and cached is not None:
+        return cached[3]
     if response.status_code == 200:
-        data = response.json()
+        data = loads(response.content)
+        if revalidate:
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if etag or last_modified:
+                _CONDITIONAL_CACHE[device_code] = (request_key, etag, last_modified, data)
+            else:
+                _CONDITIONAL_CACHE.pop(device_code, None)
         # Optionally save the response to disk
         # try:
         #     with open(data_dir / f"{device_code}_rawdata.json", "w") as f:
@@ -74,7 +175,7 @@ def fetch_onc_realtime_data(device_code, date_from, get_latest=False, row_limit=
         #     logging.error(f"Failed to save raw data: {e}")
         return data
     else:
-        logging.error(f"Error: {response.status_code} - {response.text}")
+        logger.error("Error: %s - %s", response.status_code, response.text)
         return None
 
 
@@ -83,43 +184,82 @@ class RawDataFetcher:
         self.onc_api_token = ONC_API_TOKEN
         self.next_date = start_date
         self.device_code = "SILIXADTSXT19083"
-        self.json_data = []
+        self.json_data = deque()
+        self._prefetch = None  # (date_from, Future) of the page in flight
+        # One long-lived daemon worker fetches the next page while the caller parses the
+        # current one. Daemon so Ctrl+C does not wait for an in-flight request on exit, and
+        # long-lived so its thread-local simdjson parser is reused for every prefetched page.
+        self._prefetch_queue = queue.Queue()
+        threading.Thread(target=self._prefetch_worker, args=(self._prefetch_queue, self.device_code),
+                         name="onc-prefetch", daemon=True).start()
+
+    @staticmethod
+    def _prefetch_worker(requests_queue, device_code):
+        while True:
+            date_from, future = requests_queue.get()
+            try:
+                future.set_result(fetch_onc_realtime_data(device_code, date_from, row_limit=ROW_LIMIT,
+                                                          loads=_parse_rawdata_page))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def _prefetch_page(self, date_from):
+        future = Future()
+        self._prefetch_queue.put((date_from, future))
+        self._prefetch = (date_from, future)
+
+    def _fetch_page(self, date_from):
+        if self._prefetch is not None:
+            prefetch_date, future = self._prefetch
+            self._prefetch = None
+            if prefetch_date == date_from:
+                return future.result()
+        return fetch_onc_realtime_data(self.device_code, date_from, row_limit=ROW_LIMIT,
+                                       loads=_parse_rawdata_page)
         
     def _fetch_next(self):
         found_data = False
         
+        backoff = 1.0
         while self.next_date is None:
-            sys.stdout.write(next(spinner))
-            sys.stdout.flush()
-            result = fetch_onc_realtime_data(self.device_code, self.last_date, get_latest=False, row_limit=1)
+            result = fetch_onc_realtime_data(self.device_code, self.last_date, get_latest=False, row_limit=1,
+                                             loads=_parse_rawdata_page, revalidate=True)
             try:
                 self.next_date = result['next']['parameters']['dateFrom'] # if result['next'] else None
             except (KeyError, TypeError):
                 self.next_date = None
-                #logging.info('No next date found, waiting to retry...')
-                sleep(5) # wait a bit before retrying
-            sys.stdout.write('\b')
+                logger.debug('No next date found, retrying in %.0f s...', backoff)
+                sleep(backoff) # wait a bit before retrying
+                backoff = min(backoff * 2, 60)
         
+        backoff = 1.0
         while not found_data and self.next_date is not None:
-            logging.debug(f'Fetching data from {self.next_date}')
-            result = fetch_onc_realtime_data(self.device_code, self.next_date)
-            logging.debug(f'Fetched {len(result["data"])} items')
+            logger.debug('Fetching data from %s', self.next_date)
+            result = self._fetch_page(self.next_date)
+            if result is None:
+                # Request failed, retry the same dateFrom after backing off
+                logger.warning('Fetching data from %s failed, retrying in %.0f s...', self.next_date, backoff)
+                sleep(backoff)
+                backoff = min(backoff * 2, 60)
+                continue
+            backoff = 1.0
+            logger.debug('Fetched %d items', len(result['data']))
             
+            # Only getData records are decoded, everything else is skipped unparsed
             for item in result['data']:
                 raw_data = item['rawData']
-                if len(raw_data) > 80:
-                    raw_data =  raw_data[:80] + ' ...'
-                #print(f'{item['sampleTime']}{item['lineType']}{raw_data}')
-                
-                if item['rawData'].startswith('{"Cmd":"getData",'):
+                if raw_data.startswith(GETDATA_PREFIX):
                     found_data = True
-                    self.json_data.append(json.loads(item['rawData']))
+                    self.json_data.append(_loads(raw_data))
+                self.last_date = item['sampleTime']
+            if result['data']:
                 try:
                     self.next_date = result['next']['parameters']['dateFrom'] # if result['next'] else None
                 except (KeyError, TypeError):
                     self.next_date = None
-                self.last_date = item['sampleTime']
             #self.json_data.append(result)
+            if self.next_date is not None:
+                self._prefetch_page(self.next_date)
         return result
         
     def __iter__(self):
@@ -127,7 +267,7 @@ class RawDataFetcher:
     
     def __next__(self):
         if len(self.json_data):
-            return self.json_data.pop(0)
+            return self.json_data.popleft()
         else:
             self._fetch_next()
             return self.__next__()
@@ -144,7 +284,7 @@ def main() -> None:
     logging.getLogger("onc_dts.utils").setLevel(args.log_level.upper())
 
     start_time = args.start_time
-    logger.info(f"Monitoring DTS from start time: {start_time}")
+    logger.info("Monitoring DTS from start time: %s", start_time)
     # Add monitoring logic here
     
     fetcher = RawDataFetcher(start_date=start_time) # last reading: "2025-07-30T20:35:59.134Z"
@@ -152,17 +292,18 @@ def main() -> None:
     for data in fetcher:
         dts_data = parse_xt_json(data['Resp'],trim=True)
         
-        temp = dts_data['temp_data'] - 273.15 # convert from Kelvin to Celsius 273.15
+        # Decimate to every 5 m (4 samples/m) before converting from Kelvin to Celsius
+        temp = dts_data['temp_data'][0::4*5] - np.float32(273.15)
         dat_info = data['Resp']['processed data']
         print(f'## Channel {dat_info["forward channel"] + 1} - {dat_info["measurement start time"]}')
 
         chunk_size = 20
-        temp_list = ['%6.3f' % float(t)  for t in temp[0::4*5]]
-        chunks = [temp_list[i:i + chunk_size] for i in range(0, len(temp_list), chunk_size)]
+        values = temp.tolist()
 
         print('    ' + ' '.join([f'{m:5d}m' for m in range(0, 100, 5)]))
 
-        for i, chunk in enumerate(chunks):
-            print(f'{chunk_size*5*i:3d}m ' + ' '.join(chunk))
+        # One row per 100 m, formatted straight from the converted values
+        for i in range(0, len(values), chunk_size):
+            print(f'{5*i:3d}m ' + ' '.join('%6.3f' % t for t in values[i:i + chunk_size]))
         print('')
     
\ No newline at end of file
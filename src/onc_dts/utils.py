@@ -6,19 +6,52 @@ visualizing the temperature data.
 """
 
 import json
-from base64 import b64decode
-from typing import Dict, Any, Union, Optional, List, Tuple
+try:
+    from pybase64 import b64decode  # SIMD-accelerated, same API as base64.b64decode
+except ImportError:
+    from base64 import b64decode
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Union, Optional, List, Tuple, Mapping
 from pathlib import Path
 
 try:
     import numpy as np
-    import matplotlib.pyplot as plt
 except ImportError as e:
-    print("Required libraries are not installed. Please install numpy and matplotlib.")
+    print("Required libraries are not installed. Please install numpy.")
+
+@lru_cache(maxsize=8)
+def _distance(pt_from: int, pt_to: int, dz: float) -> "np.ndarray":
+    """Return the (cached, read-only) distance array for points pt_from..pt_to."""
+    distance = (np.arange(pt_from, pt_to) - pt_from) * dz
+    distance.setflags(write=False)
+    return distance
+
+# Number of external points per channel, read-only so it is safe as a default argument
+_DEFAULT_CHANNEL_POINTS = MappingProxyType({1: 2206, 2: 1561})
+
+# Signals shorter than this (in base64 characters) are always decoded in full
+_MIN_PARTIAL_DECODE = 4096
+
+def _is_plain_base64(data: str) -> bool:
+    """Return True if data is unwrapped base64, so character offsets map directly to bytes."""
+    return len(data) % 4 == 0 and not any(c in data for c in ' \t\r\n')
+
+def _decode_float32_window(data: str, start: int, stop: int) -> "np.ndarray":
+    """Decode only float32 samples start..stop from a base64 encoded signal.
+
+    Base64 maps every 4 characters to 3 bytes, so the slice is widened to
+    whole 4-character groups and the surplus leading bytes are skipped.
+    """
+    byte_from, byte_to = start * 4, stop * 4
+    b64_from = (byte_from // 3) * 4
+    b64_to = min(((byte_to + 2) // 3) * 4, len(data))
+    return np.frombuffer(b64decode(data[b64_from:b64_to]), dtype='<f4',
+                         count=stop - start, offset=byte_from % 3)
 
 def parse_xt_json(json_data: Dict[str, Any], 
                   file_name: str = "unknown.xt",
-                  channel_points: Dict[int, int] = {1: 2206, 2: 1561},
+                  channel_points: Mapping[int, int] = _DEFAULT_CHANNEL_POINTS,
                   include_raw: bool = False,
                   trim: bool = True) -> Dict[str, Any]:
     """Parse the JSON data from a .xt file and extract key information.
@@ -44,25 +77,42 @@ def parse_xt_json(json_data: Dict[str, Any],
     Raises:
         KeyError: If required fields are missing from the JSON data
     """
+    processed = json_data['processed data']
+    temperature = processed['resampled temperature data']
+    channel = processed.get('forward channel', 0) + 1
+    dz = temperature['dz']
+    pt_from = temperature['first external point']
+    n_external_points = channel_points[channel]
+
     # Extract metadata from the JSON structure
     metadata = {
-        'channel': json_data['processed data'].get('forward channel', 0) + 1,
-        'dz': json_data['processed data']['resampled temperature data']['dz'],
-        'first_external_point': json_data['processed data']['resampled temperature data']['first external point'],
+        'channel': channel,
+        'dz': dz,
+        'first_external_point': pt_from,
         'filename': file_name,
         'datetime': json_data.get('date time', None),
     }
     
     # Add derived metadata
-    metadata['n_external_points'] = channel_points[metadata['channel']]
-    metadata['external_length'] = metadata['n_external_points'] * metadata['dz']
-    metadata['total_length'] = metadata['external_length'] + metadata['first_external_point'] * metadata['dz']
+    metadata['n_external_points'] = n_external_points
+    metadata['external_length'] = n_external_points * dz
+    metadata['total_length'] = metadata['external_length'] + pt_from * dz
     
     # Extract temperature data (keeping in Kelvin for now)
-    temp_data = np.frombuffer(
-        b64decode(json_data['processed data']['resampled temperature data']['signal']['Data']), 
-        dtype='<f4'
-    )
+    signal = temperature['signal']['Data']
+    pt_to = pt_from + n_external_points
+    n_samples = None
+    if trim and len(signal) >= _MIN_PARTIAL_DECODE and _is_plain_base64(signal):
+        n_samples = (len(signal) * 3 // 4 - signal[-2:].count('=')) // 4
+    
+    if n_samples is not None and pt_to <= n_samples:
+        # Only decode the external points instead of the whole signal
+        temp_data = _decode_float32_window(signal, pt_from, pt_to)
+    else:
+        temp_data = np.frombuffer(b64decode(signal), dtype='<f4')
+        n_samples = len(temp_data)
+        if trim:
+            temp_data = temp_data[pt_from:pt_to]
     
     result = {
         'metadata': metadata,
@@ -70,14 +120,10 @@ def parse_xt_json(json_data: Dict[str, Any],
     }
     
     # Calculate the distance array based on first external point
-    pt_from = metadata['first_external_point']
-    pt_to = pt_from + channel_points[metadata['channel']]
-    
     if trim:
-        distance = (np.arange(pt_from, pt_to) - pt_from) * metadata['dz']
-        result['temp_data'] = temp_data[pt_from:pt_to]
+        distance = _distance(pt_from, pt_to, dz)
     else:
-        distance = np.arange(0, len(temp_data)) * metadata['dz']
+        distance = _distance(0, n_samples, dz)
         
     result['distance'] = distance
     
@@ -95,26 +141,26 @@ def parse_xt_json(json_data: Dict[str, Any],
             result['raw_data'] = raw_data
     
     # Extract raw forward data if available
-    if 'resampled forward raw data' in json_data['processed data']:
+    if 'resampled forward raw data' in processed:
         raw_fwd = np.frombuffer(
-            b64decode(json_data['processed data']['resampled forward raw data']['signal']['Data']), 
+            b64decode(processed['resampled forward raw data']['signal']['Data']), 
             dtype='<f4'
         )
         # Reshape if necessary - typically for multi-channel data
-        if len(raw_fwd) > len(temp_data):
+        if len(raw_fwd) > n_samples:
             # Determine number of channels from the JSON or use default of 2
-            channels = json_data['processed data'].get('number of channels', 2)
+            channels = processed.get('number of channels', 2)
             raw_fwd = raw_fwd.reshape(channels, -1)
         result['raw_fwd'] = raw_fwd
     
     # Extract raw reverse data if available
-    if 'resampled reverse raw data' in json_data['processed data']:
+    if 'resampled reverse raw data' in processed:
         raw_rev = np.frombuffer(
-            b64decode(json_data['processed data']['resampled reverse raw data']['signal']['Data']), 
+            b64decode(processed['resampled reverse raw data']['signal']['Data']), 
             dtype='<f4'
         )
         # Reshape if necessary based on forward data
-        if 'raw_fwd' in result and len(raw_rev) > len(temp_data):
+        if 'raw_fwd' in result and len(raw_rev) > n_samples:
             raw_rev = raw_rev.reshape(result['raw_fwd'].shape[0], -1)
         result['raw_rev'] = raw_rev
     
@@ -124,7 +170,7 @@ def parse_xt_json(json_data: Dict[str, Any],
 def read_xt_file(file_path: Union[str, Path], 
                  include_raw: bool = False,
                  trim: bool = True, 
-                 channel_points: Dict[int, int] = {1: 2206, 2: 1561}) -> Dict[str, Any]:
+                 channel_points: Mapping[int, int] = _DEFAULT_CHANNEL_POINTS) -> Dict[str, Any]:
     """Reads and parses a .xt file, extracting temperature data and metadata.
     
     This function opens a .xt file (JSON format), extracts temperature data,
@@ -163,7 +209,7 @@ def read_xt_file(file_path: Union[str, Path],
     parsed_data = parse_xt_json(json_data, file_path.name, channel_points, include_raw, trim)
     
     # Convert temperature from Kelvin to Celsius
-    parsed_data['temp_data'] = parsed_data['temp_data'] - 273.15
+    parsed_data['temp_data'] = parsed_data['temp_data'] - np.float32(273.15)
     
     return parsed_data
 
@@ -187,6 +233,9 @@ def plot_dts_data(file_data: Dict[str, Any],
     Returns:
         None: The function creates and displays the plot
     """
+    # Imported here so parsing DTS data does not pay for loading matplotlib
+    import matplotlib.pyplot as plt
+
     # Extract relevant data from the file_data dictionary
     temp_data = file_data['temp_data']
     distance = file_data['distance']
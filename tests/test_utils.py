@@ -0,0 +1,73 @@
+"""Regression checks for the windowed base64 decode in parse_xt_json."""
+
+from base64 import b64encode
+
+import numpy as np
+import pytest
+
+from onc_dts import utils
+from onc_dts.utils import parse_xt_json
+
+# 1000 float32 samples -> 4000 bytes, which is not a multiple of 3, so the
+# base64 signal ends in '==' padding and is long enough for the partial decode
+N_SAMPLES = 1000
+
+
+def _make_json(signal: str, pt_from: int) -> dict:
+    return {
+        'processed data': {
+            'forward channel': 0,
+            'resampled temperature data': {
+                'dz': 0.25,
+                'first external point': pt_from,
+                'signal': {'Data': signal},
+            },
+        },
+    }
+
+
+@pytest.fixture
+def full():
+    rng = np.random.default_rng(0)
+    return (rng.random(N_SAMPLES, dtype=np.float32) * 30 + 273.15).astype('<f4')
+
+
+@pytest.mark.parametrize('pt_from, n_points', [
+    (300, 500),                   # byte_from % 3 == 0
+    (301, 500),                   # byte_from % 3 == 1
+    (302, 500),                   # byte_from % 3 == 2
+    (700, N_SAMPLES - 700),       # window reaches the padded tail
+])
+def test_trim_matches_full_decode(full, pt_from, n_points):
+    signal = b64encode(full.tobytes()).decode()
+    assert signal.endswith('==') and len(signal) >= utils._MIN_PARTIAL_DECODE
+
+    result = parse_xt_json(_make_json(signal, pt_from), channel_points={1: n_points}, trim=True)
+
+    np.testing.assert_array_equal(result['temp_data'], full[pt_from:pt_from + n_points])
+    assert len(result['distance']) == n_points
+
+
+def test_line_wrapped_signal_uses_full_decode(full, monkeypatch):
+    signal = b64encode(full.tobytes()).decode()
+    # 60-character lines keep the total length a multiple of 4, so only the
+    # whitespace check can route this signal to the full decode
+    wrapped = '\n'.join(signal[i:i + 60] for i in range(0, len(signal), 60))
+    assert len(wrapped) % 4 == 0
+
+    def fail(*args, **kwargs):
+        raise AssertionError('partial decode used on a line-wrapped signal')
+    monkeypatch.setattr(utils, '_decode_float32_window', fail)
+
+    result = parse_xt_json(_make_json(wrapped, 301), channel_points={1: 500}, trim=True)
+
+    np.testing.assert_array_equal(result['temp_data'], full[301:801])
+
+
+def test_untrimmed_returns_full_signal(full):
+    signal = b64encode(full.tobytes()).decode()
+
+    result = parse_xt_json(_make_json(signal, 301), channel_points={1: 500}, trim=False)
+
+    np.testing.assert_array_equal(result['temp_data'], full)
+    assert len(result['distance']) == N_SAMPLES